@@ -6,30 +6,126 @@ Hybrid approach: Selenium for login + form interaction, then parallel JS fetch()
 
 import os
 import io
+import re
 import csv
+import math
 import time
-import asyncio
-import tempfile
 import shutil
-from typing import Optional
+import hmac
+import hashlib
+import secrets
+import threading
+import fcntl
+import atexit
+import asyncio
+from typing import Literal, Optional
+from contextlib import AsyncExitStack, asynccontextmanager, aclosing, nullcontext, suppress
 from datetime import datetime
-from urllib.parse import urlparse, parse_qs, urlencode
+from html.parser import HTMLParser
+from urllib.parse import urlparse, parse_qs, urlencode, urljoin
 
+import aiohttp
+import anyio
+import orjson
 from fastapi import FastAPI, HTTPException, Header
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from starlette.background import BackgroundTask
 from pydantic import BaseModel
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import Select
-from selenium.common.exceptions import TimeoutException
-import json
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
 
-app = FastAPI(title="Listing Notifier Scraper", version="5.0.0")
+app = FastAPI(title="Listing Notifier Scraper", version="5.0.0", default_response_class=ORJSONResponse)
+# Listing payloads are repetitive text; only applied when the client sends Accept-Encoding: gzip
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 API_SECRET = os.environ.get("API_SECRET", "")
 
+# Selenium's default 0.5s poll rounds every explicit wait up by up to half a second
+WAIT_POLL_FREQUENCY = 0.05
+
+# Number of warm Chrome instances kept between requests (0 = launch per request)
+DRIVER_POOL_SIZE = int(os.environ.get("DRIVER_POOL_SIZE", "2"))
+# Requests a pooled Chrome serves before it is replaced (0 = never)
+DRIVER_MAX_USES = int(os.environ.get("DRIVER_MAX_USES", "50"))
+# Seconds an idle pooled Chrome stays logged in for its last user before it is wiped
+DRIVER_LOGIN_TTL = int(os.environ.get("DRIVER_LOGIN_TTL", "1200"))
+
+# Opt-in on-disk Chrome profiles, one per credential, under this directory (empty = pooled
+# incognito drivers). A profile keeps PCC's HTTP cache and session cookies across requests and
+# restarts, at the cost of a cold Chrome launch per request.
+PROFILE_ROOT = os.environ.get("PROFILE_ROOT", "")
+# Least recently used profiles beyond this many are deleted (0 = keep all)
+PROFILE_MAX_COUNT = int(os.environ.get("PROFILE_MAX_COUNT", "20"))
+
+# HMAC key for credential_key, which names the profile directories and cache entries. Unset, each
+# process picks a random key, so profiles aren't reused across restarts or uvicorn workers
+CREDENTIAL_SECRET = os.environ.get("CREDENTIAL_SECRET", "").encode() or secrets.token_bytes(32)
+
+# Seconds to back off before each retry of a timed-out login/navigation step
+NAV_RETRY_DELAYS = (1, 2, 4)
+# No new retry starts once this many seconds have passed since a step's first attempt
+NAV_RETRY_DEADLINE = int(os.environ.get("NAV_RETRY_DEADLINE", "60"))
+
+PCC_ORIGIN = "https://www.propertycontrolcenter.com"
+
+USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/129.0.0.0 Safari/537.36"
+)
+
+# How CSV pages are downloaded once logged in:
+#   "browser" - fetch() inside the logged-in tab (default; requests look like the real browser to Akamai)
+#   "http"    - hand the session cookies to aiohttp; pages that fail are retried in the browser
+CSV_FETCH_MODE = os.environ.get("CSV_FETCH_MODE", "browser")
+
+# Max CSV pages in flight at once (browser fetch() or HTTP); enough to overlap RTTs without tripping the WAF
+HTTP_FETCH_CONCURRENCY = int(os.environ.get("HTTP_FETCH_CONCURRENCY", "6"))
+
+# The scrape only needs DOM + XHR; skip fetching assets and trackers on every page load
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg",
+    "*.woff", "*.woff2", "*.ttf",
+    "*.css", "*.mp4",
+    "*google-analytics*", "*googletagmanager*", "*doubleclick*", "*facebook*",
+]
+
+
+# ─── Locators ─────────────────────────────────────────
+
+_USERNAME_INPUT = (By.NAME, "username")
+_PASSWORD_INPUT = (By.NAME, "password")
+_LOGIN_BUTTON = (By.CSS_SELECTOR, "input[type='submit'][value='Login'], input.button.submit")
+_SEARCH_MENU = (By.XPATH, "//li[@class='toproot']/a[text()='Search']")
+_POWER_SEARCH_LINK = (By.XPATH, "//a[@href='/users/?action=powersearch'][text()='Power Search']")
+_REPORT_FILTER = (By.ID, "reportFilter")
+_POPUP_PANEL = (By.ID, "panel-1012-bodyWrap")
+_POPUP_CLOSE = (By.ID, "tool-1013")
+_STATUS_SELECT = (By.CSS_SELECTOR, "#reportFilter select[name='status']")
+_STATE_RADIO = (By.CSS_SELECTOR, "#reportFilter input[name='Search'][value='State']")
+_STATE_SELECTOR = (By.ID, "stateSelector")
+_DATE_RADIO_TPL = "#reportFilter input[name='dt'][value='{}']"
+_ACRES_INPUT = (By.CSS_SELECTOR, "#reportFilter input[name='la']")
+_SUBMIT_BUTTONS = (
+    (By.CSS_SELECTOR, "#reportFilter input[type='submit']"),
+    (By.XPATH, "//input[@value='Search']"),
+    (By.XPATH, "//input[@value='Run Search']"),
+)
+_RESULTS_TABLE = (By.CSS_SELECTOR, "table.dataTable")
+_PAGINATION_LINKS = (By.CSS_SELECTOR, "ul.pagination li a")
+
+# time_range -> value of the Power Search 'dt' radio
+DATE_RANGE_VALUES = {
+    "24h": "Last24Hours",
+    "7d": "LastWeek",
+    "14d": "LastMonth",
+    "30d": "LastMonth",
+}
+
 
 # ─── Models ───────────────────────────────────────────
 
@@ -40,6 +136,10 @@ class ScrapeRequest(BaseModel):
     listing_status: str = "Active"
     max_pages: int = 50
     min_acres: float = 0
+    # "csv" is the same as sending Accept: text/csv to /scrape
+    format: Literal["json", "csv"] = "json"
+    # Skip the RESULT_TTL cache and always scrape
+    no_cache: bool = False
 
 
 class LoginTestRequest(BaseModel):
@@ -68,158 +168,600 @@ def log(msg: str):
 
 # ─── Selenium Helpers ─────────────────────────────────
 
-def create_driver() -> tuple[webdriver.Chrome, str]:
-    """Create a headless Chrome WebDriver with anti-detection. Returns (driver, temp_profile_path)."""
-    options = Options()
-    options.add_argument("--headless=new")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--window-size=1920,1080")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--disable-extensions")
-    options.add_argument("--disable-software-rasterizer")
-    options.add_argument("--disable-background-networking")
-    options.add_argument("--disable-default-apps")
-    options.add_argument("--disable-sync")
-    options.add_argument("--disable-translate")
-    options.add_argument("--metrics-recording-only")
-    options.add_argument("--no-first-run")
-    options.add_argument("--safebrowsing-disable-auto-update")
-    options.add_argument("--blink-settings=imagesEnabled=false")
+_CHROME_ARGS = (
+    "--headless=new",
+    "--disable-gpu",
+    "--window-size=1920,1080",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-software-rasterizer",
+    "--disable-background-networking",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-translate",
+    "--metrics-recording-only",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--mute-audio",
+    # One renderer process per browser instead of per site: less RAM per pooled Chrome.
+    # Chrome only honours the last --disable-features, so every feature goes in this one flag.
+    "--disable-features=IsolateOrigins,site-per-process,Translate,BackForwardCache,MediaRouter,OptimizationHints",
+    "--safebrowsing-disable-auto-update",
+    "--blink-settings=imagesEnabled=false",
     # Anti-detection flags
-    options.add_argument("--disable-blink-features=AutomationControlled")
+    "--disable-blink-features=AutomationControlled",
+    f"user-agent={USER_AGENT}",
+)
+
+
+def _build_chrome_options(profile_dir: Optional[str] = None) -> Options:
+    options = Options()
+    for arg in _CHROME_ARGS:
+        options.add_argument(arg)
+    if profile_dir:
+        options.add_argument(f"--user-data-dir={profile_dir}")
+    else:
+        # No persistent profile: incognito keeps session state in memory only
+        options.add_argument("--incognito")
     options.add_experimental_option("excludeSwitches", ["enable-automation"])
     options.add_experimental_option("useAutomationExtension", False)
-    options.add_argument(
-        "user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/129.0.0.0 Safari/537.36"
-    )
+    # Belt and braces with BLOCKED_URL_PATTERNS: no image decoding, no notification prompts
+    options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.notifications": 2,
+    })
+    return options
+
 
-    temp_profile = tempfile.mkdtemp(prefix="selenium-profile-")
-    options.add_argument(f"--user-data-dir={temp_profile}")
+# Built once at import. webdriver.Chrome only fills in the resolved binary_location, the same on every launch
+CHROME_OPTIONS = _build_chrome_options()
 
+
+# Hide webdriver property from navigator; injected into every new document
+_STEALTH_SCRIPT = {
+    "source": """
+        Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
+        window.navigator.chrome = {runtime: {}, loadTimes: function(){}, csi: function(){}};
+        Object.defineProperty(navigator, 'languages', {get: () => ['en-US', 'en']});
+        Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]});
+    """
+}
+
+
+def create_driver(profile_dir: Optional[str] = None) -> webdriver.Chrome:
+    """Create a headless Chrome WebDriver with anti-detection (incognito unless given a profile)."""
+    options = _build_chrome_options(profile_dir) if profile_dir else CHROME_OPTIONS
     driver = webdriver.Chrome(options=options)
-    # Hide webdriver property from navigator
-    driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
-        "source": """
-            Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
-            window.navigator.chrome = {runtime: {}, loadTimes: function(){}, csi: function(){}};
-            Object.defineProperty(navigator, 'languages', {get: () => ['en-US', 'en']});
-            Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]});
-        """
-    })
+    driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", _STEALTH_SCRIPT)
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    # Explicit waits only: an implicit wait would make every find_elements miss block
+    driver.implicitly_wait(0)
     driver.set_page_load_timeout(30)
     driver.set_script_timeout(120)  # Allow time for parallel CSV fetches
-    return driver, temp_profile
+    return driver
 
 
-def cleanup_driver(driver: Optional[webdriver.Chrome], temp_profile: Optional[str]):
-    """Safely quit driver and remove temp profile directory."""
+def _wait(driver: webdriver.Chrome, timeout: float = 15) -> WebDriverWait:
+    """Explicit wait that polls at WAIT_POLL_FREQUENCY instead of Selenium's 0.5s default."""
+    return WebDriverWait(driver, timeout, poll_frequency=WAIT_POLL_FREQUENCY)
+
+
+def cleanup_driver(driver: Optional[webdriver.Chrome]):
+    """Safely quit driver."""
     if driver:
         try:
             driver.quit()
         except Exception:
             pass
-    if temp_profile:
+
+
+def reset_driver(driver: webdriver.Chrome) -> bool:
+    """Wipe session state so a pooled driver can serve the next request. Returns False if the driver is unusable."""
+    try:
+        driver.get("about:blank")
+        # delete_all_cookies() only covers the current page's domain; CDP clears every domain
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+        driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": PCC_ORIGIN, "storageTypes": "all"})
+        return True
+    except Exception as e:
+        log(f"Discarding pooled driver: {e}")
+        return False
+
+
+# A slow page or a re-rendered element; anything else (missing element, dead session) is not transient
+_RETRYABLE_ERRORS = (TimeoutException, StaleElementReferenceException)
+
+
+def with_retries(step: str, fn, *args, delays=NAV_RETRY_DELAYS, deadline=NAV_RETRY_DEADLINE, restart=None):
+    """
+    Run fn(*args), retrying after each delay in `delays` when WebDriver times out or an element
+    goes stale (PCC occasionally serves one slow page). Other exceptions, like a rejected login
+    or a dead Chrome, propagate immediately, as does the last error once `deadline` seconds have
+    passed. `restart()` runs before each retry to put the browser back on a known page.
+    """
+    give_up_at = time.monotonic() + deadline
+    for attempt, delay in enumerate((*delays, None)):
         try:
-            shutil.rmtree(temp_profile, ignore_errors=True)
-        except Exception:
-            pass
+            if attempt and restart:
+                restart()
+            return fn(*args)
+        except _RETRYABLE_ERRORS as e:
+            if delay is None or time.monotonic() + delay >= give_up_at:
+                raise
+            log(f"{step} failed ({type(e).__name__}); retrying in {delay}s")
+            time.sleep(delay)
+
+
+# ─── Driver Pool ──────────────────────────────────────
+
+_PROFILE_LOCK = ".scraper.lock"
+
+
+def _try_lock(path: str) -> Optional[int]:
+    """Non-blocking flock on `path`; returns the fd, or None if it is held or was just deleted."""
+    try:
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+    except FileNotFoundError:
+        # Another worker's prune_profiles removed the profile directory since it was created
+        return None
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        # prune_profiles may have removed the profile while we waited: that lock guards nothing
+        if os.path.exists(path) and os.fstat(fd).st_ino == os.stat(path).st_ino:
+            return fd
+    except BlockingIOError:
+        pass
+    os.close(fd)
+    return None
+
+
+async def lock_profile(profile_dir: str) -> int:
+    """
+    Take an exclusive flock on the profile (Chrome can't share a user-data-dir, and uvicorn may
+    run several workers). Polls rather than blocking a thread so a cancelled request can't end up
+    holding the lock. Close the returned fd to release it.
+    """
+    path = os.path.join(profile_dir, _PROFILE_LOCK)
+    while True:
+        os.makedirs(profile_dir, exist_ok=True)
+        fd = _try_lock(path)
+        if fd is not None:
+            os.utime(path)  # last-used time for prune_profiles
+            return fd
+        await asyncio.sleep(0.2)
+
+
+def prune_profiles(max_profiles: int):
+    """Delete the least recently used profiles beyond `max_profiles`, skipping any in use."""
+    profiles = []
+    for name in os.listdir(PROFILE_ROOT):
+        lock_path = os.path.join(PROFILE_ROOT, name, _PROFILE_LOCK)
+        if os.path.isfile(lock_path):
+            profiles.append((os.path.getmtime(lock_path), name))
+    profiles.sort(reverse=True)
+    for _, name in profiles[max_profiles:]:
+        fd = _try_lock(os.path.join(PROFILE_ROOT, name, _PROFILE_LOCK))
+        if fd is None:
+            continue
+        try:
+            log(f"Evicting Chrome profile {name[:12]}")
+            shutil.rmtree(os.path.join(PROFILE_ROOT, name), ignore_errors=True)
+        finally:
+            os.close(fd)
+
+
+def driver_alive(driver: webdriver.Chrome) -> bool:
+    """Cheap round trip to catch a Chrome that crashed while it sat idle."""
+    try:
+        driver.current_url
+        return True
+    except Exception:
+        return False
+
+
+class DriverPool:
+    """
+    Bounded pool of pre-warmed headless Chrome instances shared across requests.
+    Saves the Chrome cold start on every call and caps how many browsers (~500MB each)
+    can run at once. A size of 0 disables pooling: every request launches its own driver.
+
+    A driver checked out with an `owner` (credential_key) goes back still logged in, and the
+    next checkout by the same owner gets it again so login_to_pcc can skip the form. A driver
+    is wiped with reset_driver before it is handed to anyone else, or once it has sat idle
+    for DRIVER_LOGIN_TTL.
+
+    With PROFILE_ROOT set, owned checkouts skip the pool and launch Chrome on the owner's
+    persistent profile instead; it still counts against `size` browsers. Nothing is kept idle
+    then: no drivers are pre-warmed, and an owner-less checkout's driver is quit afterwards.
+    """
+
+    def __init__(self, size: int, max_uses: int = 0):
+        self.size = size
+        self.max_uses = max_uses
+        self._idle: list = []  # (driver, times used, owner or None), oldest first
+        self._slots = asyncio.Semaphore(max(size, 1))
+        self._live: set = set()  # every driver this pool launched and has not quit yet
+        self._kept_at: dict = {}  # idle logged-in driver -> when it was returned
+        self._reaper: Optional[asyncio.Task] = None
+        atexit.register(self.quit_all)
+
+    async def _launch(self) -> webdriver.Chrome:
+        driver = await asyncio.to_thread(create_driver)
+        self._live.add(driver)
+        return driver
+
+    async def _discard(self, driver: webdriver.Chrome):
+        self._live.discard(driver)
+        self._kept_at.pop(driver, None)
+        await asyncio.to_thread(cleanup_driver, driver)
+
+    async def start(self):
+        """Launch `size` drivers up front. Failures are logged; acquire() launches on demand."""
+        # Owned checkouts launch Chrome on their profile instead, so warm incognito drivers would go unused
+        for _ in range(0 if PROFILE_ROOT else self.size):
+            try:
+                self._idle.append((await self._launch(), 0, None))
+            except Exception as e:
+                log(f"Could not pre-warm Chrome: {e}")
+                break
+        log(f"Driver pool ready ({len(self._idle)}/{self.size} warm)")
+        if self.size > 0 and DRIVER_LOGIN_TTL:
+            self._reaper = asyncio.create_task(self._reap())
+
+    async def _reap(self):
+        """Every minute, wipe logged-in idle drivers older than DRIVER_LOGIN_TTL."""
+        while True:
+            await asyncio.sleep(60)
+            try:
+                await self._reap_expired()
+            except Exception as e:
+                log(f"Driver reaper failed: {e}")
+
+    async def _reap_expired(self):
+        cutoff = time.time() - DRIVER_LOGIN_TTL
+        for driver in [e[0] for e in self._idle if e[2] is not None and self._kept_at.get(e[0], 0) < cutoff]:
+            # Take the slot before pulling the driver out of _idle, so it is never neither idle nor
+            # counted against `size` (a request would launch another Chrome in its place)
+            async with self._slots:
+                entry = next((e for e in self._idle if e[0] is driver), None)
+                # Checked out, or returned again by its owner, while we waited for the slot
+                if entry is None or entry[2] is None or self._kept_at.get(driver, 0) >= cutoff:
+                    continue
+                self._idle.remove(entry)
+                self._kept_at.pop(driver, None)
+                if await asyncio.to_thread(reset_driver, driver):
+                    self._idle.append((driver, entry[1], None))
+                else:
+                    await self._discard(driver)
+
+    async def stop(self):
+        if self._reaper:
+            self._reaper.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._reaper
+            self._reaper = None
+        while self._idle:
+            driver, _, _ = self._idle.pop()
+            await self._discard(driver)
+
+    def capabilities(self) -> Optional[dict]:
+        """Capabilities of any Chrome this pool is running, without taking a slot (no browser call)."""
+        driver = next(iter(self._live), None)
+        return driver.capabilities if driver else None
+
+    def quit_all(self):
+        """atexit fallback: don't leave orphaned Chrome processes if shutdown never ran."""
+        for driver in list(self._live):
+            cleanup_driver(driver)
+        self._live.clear()
+
+    async def _checkout(self, owner: Optional[str]) -> tuple:
+        """Pick an idle driver: the owner's own session first, then a clean one, then the oldest."""
+        if not self._idle:
+            return await self._launch(), 0
+        owners = [entry[2] for entry in self._idle]
+        if owner and owner in owners:
+            index = owners.index(owner)
+        elif None in owners:
+            index = owners.index(None)
+        else:
+            index = 0  # only other users' sessions left: wipe the oldest
+        driver, uses, idle_owner = self._idle.pop(index)
+        self._kept_at.pop(driver, None)
+        if idle_owner not in (None, owner):
+            usable = await asyncio.to_thread(reset_driver, driver)
+        else:
+            usable = await asyncio.to_thread(driver_alive, driver)
+        if not usable:
+            log("Replacing dead pooled driver")
+            await self._discard(driver)
+            return await self._launch(), 0
+        return driver, uses
+
+    @asynccontextmanager
+    async def _profile_driver(self, owner: str):
+        # owner is a credential_key HMAC hex digest, so it is safe as a directory name and nobody with
+        # a different password can land in an already logged-in profile
+        profile_dir = os.path.join(PROFILE_ROOT, owner)
+        fd = await lock_profile(profile_dir)
+        try:
+            async with self._slots if self.size > 0 else nullcontext():
+                driver = await asyncio.to_thread(create_driver, profile_dir)
+                self._live.add(driver)
+                try:
+                    yield driver
+                finally:
+                    # Chrome must be gone before the flock is dropped, even on a client disconnect
+                    with anyio.CancelScope(shield=True):
+                        await self._discard(driver)
+        finally:
+            os.close(fd)
+        if PROFILE_MAX_COUNT:
+            await asyncio.to_thread(prune_profiles, PROFILE_MAX_COUNT)
+
+    @asynccontextmanager
+    async def acquire(self, owner: Optional[str] = None):
+        """Check out a driver; it is returned to the pool afterwards (reset unless kept for `owner`)."""
+        if PROFILE_ROOT and owner:
+            async with self._profile_driver(owner) as driver:
+                yield driver
+            return
+
+        if self.size <= 0:
+            driver = await asyncio.to_thread(create_driver)
+            try:
+                yield driver
+            finally:
+                with anyio.CancelScope(shield=True):
+                    await asyncio.to_thread(cleanup_driver, driver)
+            return
+
+        async with self._slots:
+            driver, uses = await self._checkout(owner)
+            failed = True
+            try:
+                yield driver
+                failed = False
+            finally:
+                # Shielded: a client disconnect cancels the request task, and an unfinished return
+                # would leave a live Chrome that is neither idle nor holding a slot
+                with anyio.CancelScope(shield=True):
+                    uses += 1
+                    # Long-lived Chrome processes slowly leak memory, so recycle after max_uses
+                    if self.max_uses and uses >= self.max_uses:
+                        log(f"Recycling pooled driver after {uses} uses")
+                        await self._discard(driver)
+                    elif owner and not failed:
+                        self._kept_at[driver] = time.time()
+                        self._idle.append((driver, uses, owner))
+                    elif PROFILE_ROOT:
+                        # An idle incognito Chrome would sit beside the profile Chromes, over `size`
+                        await self._discard(driver)
+                    elif await asyncio.to_thread(reset_driver, driver):
+                        self._idle.append((driver, uses, None))
+                    else:
+                        await self._discard(driver)
+
+
+driver_pool = DriverPool(DRIVER_POOL_SIZE, DRIVER_MAX_USES)
 
 
 # ─── Login ────────────────────────────────────────────
 
+def insert_text(driver: webdriver.Chrome, element, text: str):
+    """
+    Type `text` into `element` as a single CDP insertText (fires input events like typing)
+    instead of send_keys' key event per character. Focused from script, not clicked, so an
+    overlay on the form can't intercept it.
+    """
+    driver.execute_script("arguments[0].focus();", element)
+    driver.execute_cdp_cmd("Input.insertText", {"text": text})
+
+
+# Same check as has_login_form, evaluated in the page
+_HAS_LOGIN_FORM_JS = "return document.getElementsByName('username').length > 0"
+
+
 def login_to_pcc(driver: webdriver.Chrome, username: str, password: str):
     """Login to PCC via Selenium."""
     log("Navigating to PCC login page...")
-    driver.get("https://www.propertycontrolcenter.com/users/")
-    time.sleep(3)
+    driver.get(f"{PCC_ORIGIN}/users/")
+
+    wait = _wait(driver)
+    # A retry after a slow post-login page can land here already authenticated
+    wait.until(EC.any_of(EC.presence_of_element_located(_USERNAME_INPUT),
+                         EC.presence_of_element_located(_SEARCH_MENU)))
+    if not driver.find_elements(*_USERNAME_INPUT):
+        log("Already logged in")
+        return
 
     log("Filling login form...")
-    wait = WebDriverWait(driver, 15)
-    username_field = wait.until(EC.presence_of_element_located((By.NAME, "username")))
-    password_field = driver.find_element(By.NAME, "password")
-    username_field.send_keys(username)
-    password_field.send_keys(password)
-
-    login_button = wait.until(
-        EC.element_to_be_clickable(
-            (By.CSS_SELECTOR, "input[type='submit'][value='Login'], input.button.submit")
-        )
-    )
+    username_field = driver.find_element(*_USERNAME_INPUT)
+    password_field = driver.find_element(*_PASSWORD_INPUT)
+    insert_text(driver, username_field, username)
+    insert_text(driver, password_field, password)
+
+    login_button = wait.until(EC.element_to_be_clickable(_LOGIN_BUTTON))
     login_button.click()
-    time.sleep(5)
 
-    # Verify login succeeded
-    wait.until(
-        EC.presence_of_element_located(
-            (By.XPATH, "//li[@class='toproot']/a[text()='Search']")
-        )
-    )
-    if driver.find_elements(By.NAME, "username"):
+    # Verify login succeeded (the Search menu only renders once authenticated)
+    try:
+        wait.until(EC.presence_of_element_located(_SEARCH_MENU))
+    except TimeoutException:
+        # Bad credentials re-render the form; that must not be retried as a slow page
+        if not driver.execute_script(_HAS_LOGIN_FORM_JS):
+            raise
+    if driver.execute_script(_HAS_LOGIN_FORM_JS):
         raise Exception("Login form still present after login attempt")
 
     log("Login successful")
 
 
+class _LoginFormParser(HTMLParser):
+    """Collects each <form>'s action and its named, submittable inputs."""
+
+    def __init__(self):
+        super().__init__()
+        self.forms = []
+        self._form = None
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "form":
+            self._form = {"action": attrs.get("action") or "", "fields": {}}
+            self.forms.append(self._form)
+        elif tag == "input" and self._form is not None and attrs.get("name"):
+            input_type = (attrs.get("type") or "text").lower()
+            # Keep only the first named submit button, like a real click on it
+            if input_type in ("checkbox", "radio", "button", "image") or (
+                    input_type == "submit" and self._form.get("submitted")):
+                return
+            if input_type == "submit":
+                self._form["submitted"] = True
+            self._form["fields"][attrs["name"]] = attrs.get("value") or ""
+
+    def handle_endtag(self, tag):
+        if tag == "form":
+            self._form = None
+
+
+def login_form_fields(page_text: str) -> Optional[tuple]:
+    """(action path, fields) of the form holding the username input, or None if there is none."""
+    parser = _LoginFormParser()
+    parser.feed(page_text)
+    for form in parser.forms:
+        if "username" in form["fields"]:
+            action = urlparse(urljoin("/users/", form["action"] or "/users/"))
+            return action.path + (f"?{action.query}" if action.query else ""), dict(form["fields"])
+    return None
+
+
+async def login_over_http(username: str, password: str) -> Optional[dict]:
+    """
+    Post the login form directly with aiohttp (http mode only) and return the session cookies,
+    or None if PCC didn't answer with a logged-in page. None doesn't mean the credentials are
+    wrong—Akamai may want a real browser—so callers fall back to login_to_pcc.
+    """
+    if CSV_FETCH_MODE != "http":
+        return None
+    try:
+        async with pcc_http_session({}) as session:
+            async with session.get("/users/") as response:
+                form = login_form_fields(await response.text())
+            if form is None:
+                return None
+            action, fields = form
+            fields.update(username=username, password=password)
+            async with session.post(action, data=fields) as response:
+                if response.status != 200 or not is_logged_in_page(await response.text()):
+                    log("HTTP login not accepted; using Chrome")
+                    return None
+            cookies = {cookie.key: cookie.value for cookie in session.cookie_jar}
+            if not cookies:
+                return None
+    except Exception as e:
+        log(f"HTTP login failed: {e}")
+        return None
+    remember_cookies(credential_key(username, password), cookies)
+    log("Logged in over HTTP")
+    return cookies
+
+
 # ─── Power Search ─────────────────────────────────────
 
 def navigate_to_power_search(driver: webdriver.Chrome):
     """Navigate to the Power Search page and wait for the form to load."""
-    wait = WebDriverWait(driver, 15)
+    wait = _wait(driver)
 
     log("Clicking Search menu...")
-    search_menu = wait.until(
-        EC.element_to_be_clickable(
-            (By.XPATH, "//li[@class='toproot']/a[text()='Search']")
-        )
-    )
+    search_menu = wait.until(EC.element_to_be_clickable(_SEARCH_MENU))
     search_menu.click()
-    time.sleep(1)
 
     log("Clicking Power Search link...")
-    power_search_link = wait.until(
-        EC.element_to_be_clickable(
-            (By.XPATH, "//a[@href='/users/?action=powersearch'][text()='Power Search']")
-        )
-    )
+    power_search_link = wait.until(EC.element_to_be_clickable(_POWER_SEARCH_LINK))
     power_search_link.click()
-    time.sleep(3)
 
-    wait.until(EC.presence_of_element_located((By.ID, "reportFilter")))
+    wait.until(EC.presence_of_element_located(_REPORT_FILTER))
 
-    # Close popup if present
+    # Close popup if present. It renders a beat after the form (the old code slept 3s for it),
+    # and a popup left open over the form intercepts the filter inputs and the submit
+    try:
+        _wait(driver, 2).until(EC.presence_of_element_located(_POPUP_PANEL))
+    except TimeoutException:
+        return
     try:
-        driver.find_element(By.ID, "panel-1012-bodyWrap")
-        close_button = wait.until(EC.element_to_be_clickable((By.ID, "tool-1013")))
+        close_button = wait.until(EC.element_to_be_clickable(_POPUP_CLOSE))
         close_button.click()
-        time.sleep(1)
+    except Exception as e:
+        log(f"Could not close popup dialog: {e}")
+        return
+    try:
+        # The old fixed sleep was 1s; don't let a popup that never closes cost the full wait
+        _wait(driver, 2).until(EC.invisibility_of_element_located(_POPUP_PANEL))
         log("Closed popup dialog")
-    except Exception:
-        pass
+    except TimeoutException:
+        log("Popup dialog still open after closing it; continuing")
+
+
+# One round trip that reports which filter controls the form actually has.
+_FILTER_SNAPSHOT_JS = """
+    var status = document.querySelector(arguments[0]);
+    return {
+        status: status ? Array.from(status.options, function (o) { return o.text.trim(); }) : null,
+        state: !!document.querySelector(arguments[1]),
+        dates: Array.from(document.querySelectorAll("#reportFilter input[name='dt']"), function (r) { return r.value; }),
+        acres: !!document.querySelector(arguments[2])
+    };
+"""
+
+_SELECT_OPTION_JS = """
+    var sel = document.querySelector(arguments[0]), text = arguments[1];
+    var opt = Array.from(sel.options).find(function (o) { return o.text.trim() === text; });
+    sel.value = opt.value;
+    sel.dispatchEvent(new Event('change', { bubbles: true }));
+"""
+
+_CLICK_JS = "document.querySelector(arguments[0]).click();"
+
+
+def match_option(options: list, wanted: str) -> Optional[str]:
+    """Return the option text matching `wanted` (exact first, then case-insensitive)."""
+    if wanted in options:
+        return wanted
+    lowered = wanted.strip().lower()
+    return next((text for text in options if text.lower() == lowered), None)
 
 
 def set_filters(driver: webdriver.Chrome, listing_status: str, time_range: str, min_acres: float = 0) -> dict:
     """Set filter criteria on the Power Search form to match manual search."""
     results = {"status_set": False, "date_set": False, "state_set": False, "acres_set": False}
+    snapshot = driver.execute_script(
+        _FILTER_SNAPSHOT_JS, _STATUS_SELECT[1], _STATE_RADIO[1], _ACRES_INPUT[1]
+    )
 
     # ── Listing Status (select dropdown) ──
     try:
-        status_select = driver.find_element(By.CSS_SELECTOR, "#reportFilter select[name='status']")
-        Select(status_select).select_by_visible_text(listing_status)
+        if snapshot["status"] is None:
+            raise Exception("status select not found")
+        option = match_option(snapshot["status"], listing_status)
+        if option is None:
+            raise Exception(f"no option '{listing_status}' in {snapshot['status']}")
+        driver.execute_script(_SELECT_OPTION_JS, _STATUS_SELECT[1], option)
         results["status_set"] = True
-        log(f"Set listing status to '{listing_status}'")
+        log(f"Set listing status to '{option}'")
     except Exception as e:
         log(f"Could not set status: {e}")
 
     # ── Search by State → Texas ──
     try:
+        if not snapshot["state"]:
+            raise Exception("State radio not found")
         # Click "State" radio button
-        state_radio = driver.find_element(
-            By.CSS_SELECTOR, "#reportFilter input[name='Search'][value='State']"
-        )
-        driver.execute_script("arguments[0].click();", state_radio)
-        time.sleep(1)
+        driver.execute_script(_CLICK_JS, _STATE_RADIO[1])
+        _wait(driver, 5).until(EC.presence_of_element_located(_STATE_SELECTOR))
 
         # The state selector uses a tag-input library that hides the real <select>.
         # Inject Texas (state_id=48) directly via JavaScript.
@@ -240,19 +782,12 @@ def set_filters(driver: webdriver.Chrome, listing_status: str, time_range: str,
         log(f"Could not set state filter: {e}")
 
     # ── Date Range (radio buttons: name='dt') ──
-    dt_map = {
-        "24h": "Last24Hours",
-        "7d": "LastWeek",
-        "14d": "LastMonth",
-        "30d": "LastMonth",
-    }
-    dt_value = dt_map.get(time_range, "LastWeek")
+    dt_value = DATE_RANGE_VALUES.get(time_range, "LastWeek")
 
     try:
-        radio = driver.find_element(
-            By.CSS_SELECTOR, f"#reportFilter input[name='dt'][value='{dt_value}']"
-        )
-        driver.execute_script("arguments[0].click();", radio)
+        if dt_value not in snapshot["dates"]:
+            raise Exception(f"no dt radio '{dt_value}' in {snapshot['dates']}")
+        driver.execute_script(_CLICK_JS, _DATE_RADIO_TPL.format(dt_value))
         results["date_set"] = True
         log(f"Set date range to '{dt_value}' (from time_range='{time_range}')")
     except Exception as e:
@@ -261,7 +796,9 @@ def set_filters(driver: webdriver.Chrome, listing_status: str, time_range: str,
     # ── Minimum Acreage (optional) ──
     if min_acres > 0:
         try:
-            la_input = driver.find_element(By.CSS_SELECTOR, "#reportFilter input[name='la']")
+            if not snapshot["acres"]:
+                raise Exception("acreage input not found")
+            la_input = driver.find_element(*_ACRES_INPUT)
             la_input.clear()
             la_input.send_keys(str(int(min_acres)))
             results["acres_set"] = True
@@ -272,59 +809,120 @@ def set_filters(driver: webdriver.Chrome, listing_status: str, time_range: str,
     return results
 
 
+# Returns the first rendered candidate in _SUBMIT_BUTTONS order, resolved in one round trip
+_FIND_SUBMIT_JS = """
+    var candidates = arguments[0];
+    for (var i = 0; i < candidates.length; i++) {
+        var by = candidates[i][0], value = candidates[i][1];
+        var el = by === 'xpath'
+            ? document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+            : document.querySelector(value);
+        if (el && el.getClientRects().length > 0) return el;
+    }
+    return null;
+"""
+
+
 def submit_search(driver: webdriver.Chrome):
     """Submit the Power Search form."""
-    selectors = [
-        (By.CSS_SELECTOR, "#reportFilter input[type='submit']"),
-        (By.XPATH, "//input[@value='Search']"),
-        (By.XPATH, "//input[@value='Run Search']"),
-    ]
-    for selector_type, selector_value in selectors:
-        try:
-            btn = driver.find_element(selector_type, selector_value)
-            if btn.is_displayed():
-                btn.click()
-                log(f"Clicked search button")
-                return
-        except Exception:
-            continue
+    try:
+        btn = driver.execute_script(_FIND_SUBMIT_JS, [list(b) for b in _SUBMIT_BUTTONS])
+        if btn is not None:
+            btn.click()
+            log(f"Clicked search button")
+            return
+    except Exception as e:
+        log(f"Search button click failed: {e}")
 
     driver.execute_script("document.getElementById('reportFilter').submit()")
     log("Submitted form via JavaScript")
 
 
-def get_total_pages(driver: webdriver.Chrome, per_page: int = 15) -> int:
-    """Extract total page count from the result count text on the page."""
-    import re
-    import math
-    page_text = driver.page_source
+# "X results" / "X records" / "X properties", including comma-formatted numbers like "1,521 total results"
+_TOTAL_RESULTS_RE = re.compile(r'(\d[\d,]*)\s+(?:total\s+)?(?:results?|records?|listings?|properties)', re.IGNORECASE)
 
-    # Look for "X results" or "X records" or "X properties" text
-    # Handle comma-formatted numbers like "1,521 total results"
-    matches = re.findall(r'(\d[\d,]*)\s+(?:total\s+)?(?:results?|records?|listings?|properties)', page_text, re.IGNORECASE)
-    if matches:
-        total_results = max(int(m.replace(',', '')) for m in matches)
-        total_pages = math.ceil(total_results / per_page)
-        log(f"Found {total_results} total results -> {total_pages} pages")
-        return total_pages
 
-    # Fallback: check pagination links
-    try:
-        pagination = driver.find_elements(By.CSS_SELECTOR, "ul.pagination li a")
-        page_nums = []
-        for a in pagination:
-            try:
-                data_pagenum = a.get_attribute("data-pagenum")
-                if data_pagenum:
-                    page_nums.append(int(data_pagenum))
-            except (ValueError, TypeError):
-                continue
-        if page_nums:
-            return max(page_nums)
-    except Exception:
-        pass
+def pages_for_results(total_results: int, per_page: int = 15) -> int:
+    total_pages = math.ceil(total_results / per_page)
+    log(f"Found {total_results} total results -> {total_pages} pages")
+    return total_pages
+
+
+def count_total_pages(page_text: str, per_page: int = 15) -> Optional[int]:
+    """Page count from the result count text in a results page's HTML, or None if there isn't one."""
+    matches = _TOTAL_RESULTS_RE.findall(page_text)
+    if not matches:
+        return None
+    return pages_for_results(max(int(m.replace(',', '')) for m in matches), per_page)
+
+
+def has_no_results(page_text: str) -> bool:
+    page_text = page_text.lower()
+    return "no results" in page_text or "no records" in page_text or "no listings" in page_text
+
+
+# Same element as _RESULTS_TABLE, in the raw HTML
+_RESULTS_TABLE_RE = re.compile(r"""<table[^>]*\bclass=["'][^"']*\bdataTable\b""")
+
+
+def has_results_table(page_text: str) -> bool:
+    return _RESULTS_TABLE_RE.search(page_text) is not None
+
+
+# Same check as has_no_results, evaluated in the page so only a boolean crosses the wire
+_NO_RESULTS_JS = "return /no (results|records|listings)/i.test(document.body ? document.body.innerText : '');"
+
+
+_LOGIN_FORM_RE = re.compile(r"""name=["']username["']""")
+
+
+def has_login_form(page_text: str) -> bool:
+    """True if the HTML is PCC's login page, i.e. the session was not accepted."""
+    return _LOGIN_FORM_RE.search(page_text) is not None
+
+
+# The Search menu (or its Power Search link) only renders once authenticated, like _SEARCH_MENU
+_LOGGED_IN_RE = re.compile(
+    r"""<li[^>]*class=["']toproot["'][^>]*>\s*<a[^>]*>\s*Search\s*</a>|href=["']/users/\?action=powersearch["']""")
+
 
-    return 1
+def is_logged_in_page(page_text: str) -> bool:
+    """True only for a logged-in PCC page; a WAF challenge or error page without the form is not one."""
+    return _LOGGED_IN_RE.search(page_text) is not None and not has_login_form(page_text)
+
+
+# Everything the fetch phase needs from the results page in one round trip. The result count is
+# matched in the page (same pattern as _TOTAL_RESULTS_RE), so only a few scalars cross the wire
+_RESULTS_INFO_JS = """
+    var pageNums = Array.from(document.querySelectorAll(arguments[0]), function (a) {
+        return parseInt(a.getAttribute('data-pagenum'), 10);
+    }).filter(function (n) { return !isNaN(n); });
+    var totalRe = new RegExp(arguments[1], 'gi');
+    var text = document.documentElement.textContent;
+    var total = null, match;
+    while ((match = totalRe.exec(text)) !== null) {
+        total = Math.max(total || 0, parseInt(match[1].replace(/,/g, ''), 10));
+    }
+    return {
+        url: location.href,
+        total_results: total,
+        max_page_num: pageNums.length ? Math.max.apply(null, pageNums) : null
+    };
+"""
+
+
+def read_results_page(driver: webdriver.Chrome) -> dict:
+    """{url, total_results, max_page_num} of the search results page."""
+    return driver.execute_script(_RESULTS_INFO_JS, _PAGINATION_LINKS[1], _TOTAL_RESULTS_RE.pattern)
+
+
+def get_total_pages(results_info: dict, per_page: int = 15) -> int:
+    """Total page count from the result count text on the page."""
+    if results_info["total_results"] is not None:
+        return pages_for_results(results_info["total_results"], per_page)
+
+    # Fallback: check pagination links
+    return results_info["max_page_num"] or 1
 
 
 def extract_search_params(url: str) -> dict:
@@ -334,166 +932,669 @@ def extract_search_params(url: str) -> dict:
     return {k: v[0] if len(v) == 1 else v for k, v in params.items()}
 
 
-def build_csv_url(search_params: dict, page_num: int) -> str:
-    """Build the direct CSV export URL for a given page number."""
-    params = dict(search_params)
+def build_csv_urls(search_params: dict, pages: list) -> list:
+    """Build the direct CSV export URL for each of the given page numbers."""
+    params = {k: v for k, v in search_params.items() if k != "PageNum"}
     params["export"] = "CSV"
-    params["PageNum"] = str(page_num)
-    return f"/users/?{urlencode(params)}"
+    # Only PageNum varies between pages, so the rest of the query is encoded once
+    # doseq: extract_search_params keeps a repeated param as a list
+    prefix = f"/users/?{urlencode(params, doseq=True)}&PageNum="
+    return [prefix + str(page) for page in pages]
 
 
 # ─── Parallel CSV Fetch via Browser JS ────────────────
 
-def fetch_csvs_parallel(driver: webdriver.Chrome, search_params: dict, total_pages: int) -> list:
+def fetch_csvs_parallel(driver: webdriver.Chrome, search_params: dict, pages: list,
+                        concurrency: int = HTTP_FETCH_CONCURRENCY) -> list:
     """
-    Fetch all CSV pages in parallel using browser-native fetch().
+    Fetch the given CSV page numbers in parallel using browser-native fetch().
     This bypasses the WAF (Akamai) since requests come from the actual browser session.
-    Returns list of CSV text strings.
+    At most `concurrency` requests are in flight; a 429 is retried with a short backoff.
+    Returns list of {error, text, page} dicts, in the order of `pages`.
     """
-    urls = [build_csv_url(search_params, page) for page in range(1, total_pages + 1)]
-    log(f"Fetching {len(urls)} CSV pages in parallel via JS fetch()...")
+    urls = build_csv_urls(search_params, pages)
+    log(f"Fetching {len(urls)} CSV pages in parallel via JS fetch() ({concurrency} at a time)...")
 
     js = """
     var urls = arguments[0];
+    var pages = arguments[1];
+    var concurrency = Math.max(1, arguments[2]);
     var callback = arguments[arguments.length - 1];
-    Promise.all(urls.map(function(url, idx) {
-        return fetch(url, {credentials: 'include'})
+    var results = new Array(urls.length);
+    var next = 0;
+    function fetchOne(idx, attempt) {
+        return fetch(urls[idx], {credentials: 'include'})
             .then(function(response) {
+                if (response.status === 429 && attempt < 3) {
+                    return new Promise(function(r) { setTimeout(r, 500 * attempt); })
+                        .then(function() { return fetchOne(idx, attempt + 1); });
+                }
                 if (!response.ok) {
-                    return {error: 'HTTP ' + response.status, text: '', page: idx + 1};
+                    return {error: 'HTTP ' + response.status, text: '', page: pages[idx]};
                 }
                 return response.text().then(function(text) {
-                    return {error: null, text: text, page: idx + 1};
+                    return {error: null, text: text, page: pages[idx]};
                 });
             })
             .catch(function(err) {
-                return {error: err.toString(), text: '', page: idx + 1};
+                return {error: err.toString(), text: '', page: pages[idx]};
             });
-    })).then(function(results) {
+    }
+    function worker() {
+        if (next >= urls.length) return Promise.resolve();
+        var idx = next++;
+        return fetchOne(idx, 1).then(function(result) {
+            results[idx] = result;
+            return worker();
+        });
+    }
+    var workers = [];
+    for (var i = 0; i < Math.min(concurrency, urls.length); i++) workers.push(worker());
+    Promise.all(workers).then(function() {
         callback(results);
     });
     """
-    results = driver.execute_async_script(js, urls)
+    results = driver.execute_async_script(js, urls, pages, concurrency)
+    return results
+
+
+# ─── Parallel CSV Fetch via HTTP (cookie handoff) ─────
+
+def get_session_cookies(driver: webdriver.Chrome) -> dict:
+    """Return the logged-in PCC session cookies as a name -> value dict."""
+    # One CDP call scoped to PCC, whatever page the tab is on (get_cookies() follows the current URL)
+    cookies = driver.execute_cdp_cmd("Network.getCookies", {"urls": [PCC_ORIGIN + "/"]})["cookies"]
+    return {c["name"]: c["value"] for c in cookies}
+
+
+# Keep-alive connection pool shared by every request handled on the server's event loop, so repeat
+# calls skip the TCP/TLS handshake. Opened at startup; each session keeps its own cookie jar.
+_http_connector: Optional[aiohttp.TCPConnector] = None
+_http_connector_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def new_http_connector() -> aiohttp.TCPConnector:
+    # Never open more sockets to PCC than pages in flight (on the shared connector that cap spans
+    # every concurrent scrape). Idle sockets live long enough to carry one scrape into the next;
+    # PCC's address rarely changes
+    return aiohttp.TCPConnector(limit_per_host=HTTP_FETCH_CONCURRENCY, keepalive_timeout=60, ttl_dns_cache=300)
+
+
+def pcc_http_session(cookies: dict) -> aiohttp.ClientSession:
+    """aiohttp session that talks to PCC as the logged-in browser would."""
+    # The shared pool is bound to the server loop; fetch_csvs_http runs its own loop in a worker thread
+    shared = _http_connector is not None and _http_connector_loop is asyncio.get_running_loop()
+    return aiohttp.ClientSession(
+        # CSV compresses ~5-10x; aiohttp decodes gzip/deflate transparently (br would need brotli)
+        base_url=PCC_ORIGIN, cookies=cookies, headers={"User-Agent": USER_AGENT, "Accept-Encoding": "gzip, deflate"},
+        timeout=aiohttp.ClientTimeout(total=120),
+        # Reused keep-alive connections skip the TLS handshake
+        connector=_http_connector if shared else new_http_connector(),
+        connector_owner=not shared,
+    )
+
+
+async def _fetch_csvs_http(session: aiohttp.ClientSession, urls: list, pages: list) -> list:
+    limit = asyncio.Semaphore(HTTP_FETCH_CONCURRENCY)
+
+    async def fetch(url: str, page: int) -> dict:
+        try:
+            async with limit, session.get(url) as response:
+                if response.status != 200:
+                    return {"error": f"HTTP {response.status}", "text": "", "page": page}
+                text = await response.text()
+        except Exception as e:
+            return {"error": str(e) or type(e).__name__, "text": "", "page": page}
+        # An expired session or WAF challenge comes back as an HTML page, not CSV
+        if text.lstrip().startswith("<"):
+            return {"error": "Got HTML instead of CSV", "text": "", "page": page}
+        return {"error": None, "text": text, "page": page}
+
+    return await asyncio.gather(*(fetch(url, page) for url, page in zip(urls, pages)))
+
+
+def fetch_csvs_http(cookies: dict, search_params: dict, pages: list) -> list:
+    """
+    Fetch the given CSV page numbers concurrently over plain HTTP using the browser's session
+    cookies, skipping the WebDriver bridge. Called from the scrape worker thread, so it runs its
+    own event loop. Same result shape as fetch_csvs_parallel().
+    """
+    urls = build_csv_urls(search_params, pages)
+    log(f"Fetching {len(urls)} CSV pages in parallel via HTTP...")
+
+    async def run() -> list:
+        async with pcc_http_session(cookies) as session:
+            return await _fetch_csvs_http(session, urls, pages)
+
+    return asyncio.run(run())
+
+
+def fetch_csv_pages(driver: webdriver.Chrome, search_params: dict, pages: list,
+                    cookies: Optional[dict] = None) -> list:
+    """
+    Fetch CSV pages in the browser, or over HTTP when session `cookies` are given.
+    Pages the HTTP path can't get are retried in the browser.
+    """
+    if cookies is None:
+        return fetch_csvs_parallel(driver, search_params, pages)
+
+    results = fetch_csvs_http(cookies, search_params, pages)
+    failed = [r for r in results if r.get("error")]
+    if failed:
+        log(f"HTTP fetch failed for {len(failed)} pages ({failed[0]['error']}), retrying in browser")
+        failed_pages = [r["page"] for r in failed]
+        retried = {r["page"]: r for r in fetch_csvs_parallel(driver, search_params, failed_pages)}
+        results = [retried.get(r["page"], r) for r in results]
     return results
 
 
 def parse_csv_text(text: str) -> list:
     """Parse CSV text into list of dicts."""
-    reader = csv.DictReader(io.StringIO(text))
-    return list(reader)
+    rows = list(csv.DictReader(io.StringIO(text)))
+    # Fields past the header (e.g. a trailing comma) land under a None key, which no encoder accepts
+    for row in rows:
+        row.pop(None, None)
+    return rows
+
+
+# ─── Session Cache ────────────────────────────────────
+
+# How long cookies from a Selenium login are reused for HTTP-only repeat scrapes
+SESSION_TTL = int(os.environ.get("SESSION_TTL", "1200"))
+
+# How long a search's submitted params are kept for HTTP-only repeats; outlives SESSION_TTL so an
+# HTTP re-login can reuse them
+SEARCH_PARAMS_TTL = int(os.environ.get("SEARCH_PARAMS_TTL", "86400"))
+
+# How long a finished /scrape result is served again for an identical request
+RESULT_TTL = int(os.environ.get("RESULT_TTL", "300"))
+
+_session_cache: dict = {}        # credential key -> (cookies, expires_at)
+_search_params_cache: dict = {}  # (credential key, status, range, acres) -> (submitted search params, expires_at)
+_result_cache: dict = {}         # (credential key, status, range, acres, max pages) -> (result, expires_at)
+
+
+def credential_key(username: str, password: str) -> str:
+    """
+    Cache key for a set of credentials; the password itself is never stored. Keyed with
+    CREDENTIAL_SECRET so a profile directory name is not an offline-crackable password hash.
+    """
+    return hmac.new(CREDENTIAL_SECRET, f"{username}\0{password}".encode(), hashlib.sha256).hexdigest()
+
+
+def remember_cookies(key: str, cookies: dict):
+    _session_cache[key] = (cookies, time.time() + SESSION_TTL)
+
+
+def remember_session(key: str, cookies: dict, filters: tuple, search_params: dict):
+    remember_cookies(key, cookies)
+    now = time.time()
+    # Runs in scrape worker threads while others insert and the event loop pops: list() copies the
+    # items in one step, where iterating the live dict could fail mid-way
+    for stale in [k for k, (_, expires_at) in list(_search_params_cache.items()) if expires_at < now]:
+        _search_params_cache.pop(stale, None)
+    _search_params_cache[(key, *filters)] = (search_params, now + SEARCH_PARAMS_TTL)
+
+
+def forget_cookies(key: str):
+    _session_cache.pop(key, None)
+
+
+def forget_session(key: str):
+    forget_cookies(key)
+    for cache_key in [k for k in list(_search_params_cache) if k[0] == key]:
+        _search_params_cache.pop(cache_key, None)
+
+
+def cached_cookies(key: str) -> Optional[dict]:
+    entry = _session_cache.get(key)
+    if not entry or entry[1] < time.time():
+        return None
+    return entry[0]
+
+
+def cached_search_params(key: str, filters: tuple) -> Optional[dict]:
+    """Submitted search params of a previous identical search (they outlive the cookies' TTL)."""
+    entry = _search_params_cache.get((key, *filters))
+    if not entry or entry[1] < time.time():
+        return None
+    return entry[0]
+
+
+def result_cache_key(req: ScrapeRequest) -> tuple:
+    return (credential_key(req.username, req.password),
+            req.listing_status, req.time_range, req.min_acres, req.max_pages)
+
+
+def remember_result(key: tuple, result: dict):
+    """Cache a finished /scrape result, unless some pages failed (a retry might get them)."""
+    if not RESULT_TTL or result["errors"]:
+        return
+    now = time.time()
+    for stale in [k for k, (_, expires_at) in _result_cache.items() if expires_at < now]:
+        _result_cache.pop(stale, None)
+    _result_cache[key] = (result, now + RESULT_TTL)
+
+
+def cached_result(key: tuple) -> Optional[dict]:
+    entry = _result_cache.get(key)
+    if not entry or entry[1] < time.time():
+        return None
+    return entry[0]
 
 
 # ─── Main Scrape Logic ────────────────────────────────
 
-def _do_scrape(username: str, password: str, listing_status: str, time_range: str, max_pages: int, min_acres: float = 0) -> dict:
+def run_power_search(driver: webdriver.Chrome, listing_status: str, time_range: str, min_acres: float = 0) -> bool:
     """
-    Full scrape flow:
-    1. Selenium login (~15s)
-    2. Navigate to Power Search, set filters, submit (~10s)
-    3. Parallel JS fetch() of all CSV pages (~5-15s for up to 30 pages)
-    Total: ~30-40s for hundreds of listings
+    Open Power Search, set the filters and submit. Returns True once the results table is up,
+    False if the search found nothing. Submitting only runs a search, so a retry may resubmit.
     """
-    driver = None
-    temp_profile = None
-    scrape_start = time.time()
+    navigate_to_power_search(driver)
+    set_filters(driver, listing_status, time_range, min_acres)
+    wait = _wait(driver)
+    old_page = driver.find_element(By.TAG_NAME, "html")
+    submit_search(driver)
     try:
-        log(f"Starting scrape v5.0 (status={listing_status}, range={time_range}, max_pages={max_pages}, min_acres={min_acres})...")
-        driver, temp_profile = create_driver()
-        log(f"Chrome launched in {time.time() - scrape_start:.1f}s")
+        # Wait for the form page to unload so we don't read the pre-submit DOM
+        wait.until(EC.staleness_of(old_page))
+    except TimeoutException:
+        log("Page did not reload after submit; continuing")
 
-        # Step 1: Login
-        login_to_pcc(driver, username, password)
-        log(f"Login complete at {time.time() - scrape_start:.1f}s")
+    try:
+        wait.until(EC.presence_of_element_located(_RESULTS_TABLE))
+        log("Results table found")
+        return True
+    except TimeoutException:
+        if driver.execute_script(_NO_RESULTS_JS):
+            log("Search returned no results")
+            return False
+        raise TimeoutException("Timed out waiting for search results table")
+
+
+def iter_scrape(driver: webdriver.Chrome, username: str, password: str, listing_status: str, time_range: str,
+                max_pages: int, min_acres: float = 0, batch_pages: Optional[int] = None):
+    """
+    Full scrape flow on a driver checked out from the pool, yielded as (event, data) pairs:
+    1. Selenium login (~15s)                              -> ("status", {"step": "login"})
+    2. Navigate to Power Search, set filters, submit (~10s) -> ("status", {"step": "search"})
+    3. Parallel fetch of the CSV pages (~5-15s for up to 30 pages), `batch_pages` at a time
+       (default: all at once)                             -> ("status", {"step": "fetch", ...}),
+                                                             ("listings", [new unique rows]) and
+                                                             ("page", {"pages_done", ...}) per batch
+    4. ("complete", {"total_count", "pages_scraped", "errors"})
+    Total: ~30-40s for hundreds of listings
+    """
+    scrape_start = time.time()
+    log(f"Starting scrape v5.0 (status={listing_status}, range={time_range}, max_pages={max_pages}, min_acres={min_acres})...")
+
+    # Step 1: Login
+    yield "status", {"step": "login"}
+    with_retries("Login", login_to_pcc, driver, username, password)
+    log(f"Login complete at {time.time() - scrape_start:.1f}s")
+
+    # Step 2: Navigate to Power Search and submit
+    yield "status", {"step": "search"}
+    # The Search menu is on every logged-in page; reload the landing page so a retry starts clean
+    if not with_retries("Power Search", run_power_search, driver, listing_status, time_range, min_acres,
+                        restart=lambda: driver.get(f"{PCC_ORIGIN}/users/")):
+        yield "complete", {"total_count": 0, "pages_scraped": 0, "errors": 0}
+        return
 
-        # Step 2: Navigate to Power Search and submit
-        navigate_to_power_search(driver)
-        set_filters(driver, listing_status, time_range, min_acres)
-        submit_search(driver)
-        time.sleep(3)
+    # Step 3: Determine pages and extract search params
+    results_info = read_results_page(driver)
+    total_pages = get_total_pages(results_info)
+    pages_to_fetch = min(total_pages, max_pages)
+    search_params = extract_search_params(results_info["url"])
+    log(f"Found {total_pages} pages, fetching {pages_to_fetch}")
+    log(f"Search setup complete at {time.time() - scrape_start:.1f}s")
+
+    # Step 4: Parallel CSV fetch
+    yield "status", {"step": "fetch", "total_pages": total_pages, "pages_to_fetch": pages_to_fetch}
+    fetch_start = time.time()
+    cookies = None
+    if CSV_FETCH_MODE == "http":
+        # Cache the session so the next identical scrape can skip Chrome entirely
+        cookies = get_session_cookies(driver)
+        remember_session(credential_key(username, password), cookies,
+                         (listing_status, time_range, min_acres), search_params)
+
+    pages = list(range(1, pages_to_fetch + 1))
+    batch_pages = batch_pages or len(pages) or 1
+    seen = set()
+    total_count = 0
+    errors = 0
+    for i in range(0, len(pages), batch_pages):
+        results = fetch_csv_pages(driver, search_params, pages[i:i + batch_pages], cookies)
+        listings, batch_errors = collect_listings(results, seen)
+        total_count += len(listings)
+        errors += batch_errors
+        yield "listings", listings
+        yield "page", {"pages_done": min(i + batch_pages, len(pages)), "pages_to_fetch": pages_to_fetch,
+                       "rows_so_far": total_count, "errors": errors}
+
+    log(f"Scrape complete: {total_count} listings from {pages_to_fetch} pages "
+        f"in {time.time() - scrape_start:.1f}s (fetch: {time.time() - fetch_start:.1f}s, errors: {errors})")
+    yield "complete", {"total_count": total_count, "pages_scraped": pages_to_fetch, "errors": errors}
+
+
+def _do_scrape(driver: webdriver.Chrome, username: str, password: str, listing_status: str, time_range: str,
+               max_pages: int, min_acres: float = 0) -> dict:
+    """Run iter_scrape to completion and return the /scrape response body."""
+    listings = []
+    for event, data in iter_scrape(driver, username, password, listing_status, time_range, max_pages, min_acres):
+        if event == "listings":
+            listings.extend(data)
+        elif event == "complete":
+            return {"listings": listings, **data}
+    raise Exception("Scrape ended without completing")
+
+
+async def scrape_with_cached_session(username: str, password: str, listing_status: str, time_range: str,
+                                     max_pages: int, min_acres: float = 0) -> Optional[dict]:
+    """
+    Repeat a previous identical search over plain HTTP with its cached session cookies (http mode),
+    logging in over HTTP first if those cookies expired. Returns None whenever Chrome is needed:
+    search not seen before, no session, the session was rejected, or a page failed.
+    """
+    if CSV_FETCH_MODE != "http":
+        return None
+    key = credential_key(username, password)
+    search_params = cached_search_params(key, (listing_status, time_range, min_acres))
+    if search_params is None:
+        return None
+    cookies = cached_cookies(key) or await login_over_http(username, password)
+    if cookies is None:
+        return None
 
-        wait = WebDriverWait(driver, 15)
+    scrape_start = time.time()
+    log(f"Reusing cached session (status={listing_status}, range={time_range}, max_pages={max_pages}, min_acres={min_acres})...")
+    async with pcc_http_session(cookies) as session:
         try:
-            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "table.dataTable")))
-            log("Results table found")
-        except TimeoutException:
-            page_text = driver.page_source.lower()
-            if "no results" in page_text or "no records" in page_text or "no listings" in page_text:
+            async with session.get(f"/users/?{urlencode(search_params, doseq=True)}") as response:
+                page_text = await response.text() if response.status == 200 else ""
+        except Exception as e:
+            log(f"Cached session request failed: {e}")
+            page_text = ""
+        if not page_text or has_login_form(page_text):
+            log("Cached session rejected, falling back to Chrome")
+            forget_session(key)
+            return None
+
+        total_pages = count_total_pages(page_text)
+        if total_pages is None:
+            # Like run_power_search, "no results" text only counts when there is no results table:
+            # scripts and help text can say it too, and an empty result would be cached
+            if not has_results_table(page_text) and has_no_results(page_text):
                 log("Search returned no results")
-                return {"listings": [], "total_count": 0, "pages_scraped": 0}
-            raise Exception("Timed out waiting for search results table")
+                return {"listings": [], "total_count": 0, "pages_scraped": 0, "errors": 0}
+            # Result count is split by markup or rendered client-side on this page; let Chrome handle it
+            return None
 
-        # Step 3: Determine pages and extract search params
-        total_pages = get_total_pages(driver)
         pages_to_fetch = min(total_pages, max_pages)
-        search_params = extract_search_params(driver.current_url)
-        log(f"Found {total_pages} pages, fetching {pages_to_fetch}")
-        log(f"Search setup complete at {time.time() - scrape_start:.1f}s")
-
-        # Step 4: Parallel CSV fetch via JS
-        fetch_start = time.time()
-        results = fetch_csvs_parallel(driver, search_params, pages_to_fetch)
-        fetch_elapsed = time.time() - fetch_start
-
-        # Parse all CSVs
-        all_listings = []
-        errors = 0
-        for r in results:
-            if r.get("error"):
-                log(f"Page {r.get('page', '?')} error: {r['error']}")
-                errors += 1
-            else:
-                rows = parse_csv_text(r["text"])
-                all_listings.extend(rows)
-
-        # Deduplicate by InventoryID
-        seen = set()
-        unique_listings = []
-        for listing in all_listings:
+        pages = list(range(1, pages_to_fetch + 1))
+        results = await _fetch_csvs_http(session, build_csv_urls(search_params, pages), pages)
+
+    if any(r.get("error") for r in results):
+        log("Cached session could not fetch every page, falling back to Chrome")
+        forget_session(key)
+        return None
+
+    listings, _ = collect_listings(results, set())
+    log(f"Scrape complete: {len(listings)} listings from {pages_to_fetch} pages "
+        f"in {time.time() - scrape_start:.1f}s (cached session)")
+    return {"listings": listings, "total_count": len(listings), "pages_scraped": pages_to_fetch, "errors": 0}
+
+
+def collect_listings(results: list, seen: set) -> tuple[list, int]:
+    """
+    Parse fetched CSV pages into rows, skipping InventoryIDs already in `seen` (updated in place).
+    Rows without an InventoryID are always kept. Returns (rows, error_count).
+    """
+    listings = []
+    errors = 0
+    for r in results:
+        if r.get("error"):
+            log(f"Page {r.get('page', '?')} error: {r['error']}")
+            errors += 1
+            continue
+        for listing in parse_csv_text(r["text"]):
             inv_id = listing.get("InventoryID", "")
             if inv_id and inv_id not in seen:
                 seen.add(inv_id)
-                unique_listings.append(listing)
+                listings.append(listing)
             elif not inv_id:
-                unique_listings.append(listing)
+                listings.append(listing)
+    return listings, errors
 
-        total_elapsed = time.time() - scrape_start
-        log(f"Scrape complete: {len(unique_listings)} listings from {pages_to_fetch} pages "
-            f"in {total_elapsed:.1f}s (fetch: {fetch_elapsed:.1f}s, errors: {errors})")
 
-        return {
-            "listings": unique_listings,
-            "total_count": len(unique_listings),
-            "pages_scraped": pages_to_fetch,
-        }
-    finally:
-        cleanup_driver(driver, temp_profile)
-        log("Chrome cleaned up")
+def _do_test_login(driver: webdriver.Chrome, username: str, password: str) -> dict:
+    """Run login test in a blocking thread."""
+    with_retries("Login", login_to_pcc, driver, username, password)
+    if CSV_FETCH_MODE == "http":
+        remember_cookies(credential_key(username, password), get_session_cookies(driver))
+    return {"success": True, "message": "Login successful"}
+
+
+async def test_login_with_cached_session(username: str, password: str) -> bool:
+    """True if cached cookies for these credentials still open PCC logged in (http mode only)."""
+    if CSV_FETCH_MODE != "http":
+        return False
+    key = credential_key(username, password)
+    cookies = cached_cookies(key)
+    if cookies is None:
+        return False
+    async with pcc_http_session(cookies) as session:
+        try:
+            async with session.get("/users/") as response:
+                if response.status == 200 and is_logged_in_page(await response.text()):
+                    return True
+        except Exception as e:
+            log(f"Cached session request failed: {e}")
+    # Only the cookies went stale; the search params stay valid for the next HTTP re-login
+    forget_cookies(key)
+    return False
 
 
-def _do_test_login(username: str, password: str) -> dict:
-    """Run login test in a blocking thread."""
-    driver = None
-    temp_profile = None
+# ─── Response helpers ─────────────────────────────────
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+NDJSON_CHUNK_ROWS = 200
+
+
+def wants_ndjson(accept: Optional[str]) -> bool:
+    return bool(accept) and NDJSON_MEDIA_TYPE in accept
+
+
+async def iter_ndjson(listings: list):
+    """Yield listings as newline-delimited JSON, a few hundred rows per chunk."""
+    for i in range(0, len(listings), NDJSON_CHUNK_ROWS):
+        yield b"".join(orjson.dumps(row) + b"\n" for row in listings[i:i + NDJSON_CHUNK_ROWS])
+
+
+# Pages per fetch batch on /scrape-stream, so listings arrive while later pages download
+STREAM_BATCH_PAGES = 10
+
+
+async def iterate_in_thread(iterator):
+    """
+    Drive a blocking iterator in one worker thread and yield its items on the event loop as
+    they are produced. If the consumer stops early, the thread stops after its current item
+    and this generator waits for it on close (use contextlib.aclosing), so the caller may
+    safely release resources afterwards.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    stopped = threading.Event()
+    done = object()
+
+    def run():
+        try:
+            for item in iterator:
+                loop.call_soon_threadsafe(queue.put_nowait, (item, None))
+                if stopped.is_set():
+                    break
+            loop.call_soon_threadsafe(queue.put_nowait, (done, None))
+        except Exception as e:
+            loop.call_soon_threadsafe(queue.put_nowait, (done, e))
+
+    worker = loop.run_in_executor(None, run)
     try:
-        driver, temp_profile = create_driver()
-        login_to_pcc(driver, username, password)
-        return {"success": True, "message": "Login successful"}
+        while True:
+            item, error = await queue.get()
+            if item is done:
+                if error:
+                    raise error
+                return
+            yield item
     finally:
-        cleanup_driver(driver, temp_profile)
+        stopped.set()
+        # A client disconnect cancels the response task group, and anyio re-cancels every await
+        # in this finally; shield it so close really waits for the thread to let go
+        with anyio.CancelScope(shield=True):
+            await worker
+
+
+def sse_event(event: str, data) -> bytes:
+    return b"event: " + event.encode() + b"\ndata: " + orjson.dumps(data) + b"\n\n"
+
+
+CSV_MEDIA_TYPE = "text/csv"
+CSV_HEADERS = {"Content-Disposition": "attachment; filename=listings.csv"}
+
+
+def wants_csv(accept: Optional[str]) -> bool:
+    return bool(accept) and CSV_MEDIA_TYPE in accept
+
+
+def encode_csv(rows: list, fieldnames: list, header: bool) -> bytes:
+    buf = io.StringIO()
+    writer = csv.DictWriter(buf, fieldnames=fieldnames, extrasaction="ignore")
+    if header:
+        writer.writeheader()
+    writer.writerows(rows)
+    return buf.getvalue().encode()
+
+
+async def scrape_csv_response(req: ScrapeRequest) -> Response:
+    """
+    /scrape as CSV, streamed batch by batch while later pages are still downloading.
+    Login and search run before the response starts so their failures still raise; an error
+    after that can only cut the stream short.
+    """
+    result_key = result_cache_key(req)
+    result = None if req.no_cache else cached_result(result_key)
+    if result is None:
+        result = await scrape_with_cached_session(
+            req.username, req.password,
+            req.listing_status, req.time_range, req.max_pages,
+            req.min_acres,
+        )
+        if result is not None:
+            remember_result(result_key, result)
+    if result is not None:
+        listings = result["listings"]
+        # No rows means an empty body, same as the streamed path (not a bare header line)
+        return Response(encode_csv(listings, list(listings[0]), True) if listings else b"",
+                        media_type=CSV_MEDIA_TYPE, headers=CSV_HEADERS)
+
+    stack = AsyncExitStack()
+
+    async def close_stack():
+        # Shielded like the pool's own cleanup: a disconnect must still release the driver.
+        # aclose() is idempotent, so the generator's finally and the background task can both call it
+        with anyio.CancelScope(shield=True):
+            await stack.aclose()
+
+    try:
+        driver = await stack.enter_async_context(driver_pool.acquire(credential_key(req.username, req.password)))
+        events = iter_scrape(
+            driver, req.username, req.password,
+            req.listing_status, req.time_range, req.max_pages,
+            req.min_acres, batch_pages=STREAM_BATCH_PAGES,
+        )
+        items = await stack.enter_async_context(aclosing(iterate_in_thread(events)))
+        event, data = await anext(items)
+        while event not in ("listings", "complete"):
+            event, data = await anext(items)
+    except BaseException:
+        await close_stack()
+        raise
+
+    async def generate():
+        fieldnames = None
+        listings = []  # kept so a complete stream can fill the result cache like /scrape does
+
+        def encode(rows: list) -> bytes:
+            nonlocal fieldnames
+            header = fieldnames is None
+            fieldnames = fieldnames or list(rows[0])
+            return encode_csv(rows, fieldnames, header)
+
+        def handle(next_event: str, payload) -> Optional[bytes]:
+            if next_event == "listings" and payload:
+                listings.extend(payload)
+                return encode(payload)
+            if next_event == "complete":
+                remember_result(result_key, {"listings": listings, **payload})
+            return None
+
+        try:
+            chunk = handle(event, data)
+            if chunk:
+                yield chunk
+            async for next_event, payload in items:
+                chunk = handle(next_event, payload)
+                if chunk:
+                    yield chunk
+        except Exception as e:
+            log(f"CSV stream aborted: {e}")
+            raise
+        finally:
+            await close_stack()
+
+    # Starlette can cancel the response before generate() takes its first step, and then its
+    # finally never runs; the background task releases the driver either way
+    return StreamingResponse(generate(), media_type=CSV_MEDIA_TYPE, headers=CSV_HEADERS,
+                             background=BackgroundTask(close_stack))
 
 
 # ─── Endpoints ────────────────────────────────────────
 
+@app.on_event("startup")
+async def start_driver_pool():
+    if PROFILE_ROOT and not os.environ.get("CREDENTIAL_SECRET"):
+        log("CREDENTIAL_SECRET is not set; Chrome profiles will not be reused after a restart")
+    await driver_pool.start()
+
+
+@app.on_event("startup")
+async def open_http_connector():
+    global _http_connector, _http_connector_loop
+    _http_connector = new_http_connector()
+    _http_connector_loop = asyncio.get_running_loop()
+
+
+@app.on_event("shutdown")
+async def stop_driver_pool():
+    await driver_pool.stop()
+
+
+@app.on_event("shutdown")
+async def close_http_connector():
+    if _http_connector is not None:
+        await _http_connector.close()
+
+
 @app.get("/health")
 async def health():
     return {"status": "ok", "service": "listing-notifier-scraper", "version": "5.0.0"}
 
 
-@app.get("/debug")
-async def debug():
-    """Check Chrome and ChromeDriver versions and test browser launch."""
+def _probe_versions() -> dict:
+    """Read the installed Chrome and ChromeDriver versions (blocking subprocess calls)."""
     import subprocess
-    info = {"service_version": "5.0.0"}
+    info = {}
 
     try:
         result = subprocess.run(["google-chrome", "--version"], capture_output=True, text=True, timeout=10)
@@ -507,17 +1608,43 @@ async def debug():
     except Exception as e:
         info["chromedriver_version"] = "Not installed (using SeleniumManager)"
 
+    return info
+
+
+# Versions can't change while the process runs; cached after the first successful launch check
+_debug_info: Optional[dict] = None
+
+
+@app.get("/debug")
+async def debug(
+    fresh: bool = False,
+    authorization: Optional[str] = Header(None),
+):
+    """Check Chrome and ChromeDriver versions and test browser launch (?fresh=true re-checks)."""
+    global _debug_info
+    verify_auth(authorization)
+    if _debug_info and not fresh:
+        return {**_debug_info, "cached": True, "checked_at": datetime.now().isoformat()}
+
+    info = {"service_version": "5.0.0", **await asyncio.to_thread(_probe_versions)}
+
     try:
-        driver, temp_profile = create_driver()
+        # Any running pooled Chrome proves the launch works, and reading it doesn't compete with
+        # scrapes for a slot. Only with nothing running yet (pool off or not warm) does /debug
+        # check a driver out, and then it can queue behind scrapes
+        capabilities = driver_pool.capabilities()
+        if capabilities is None:
+            async with driver_pool.acquire() as driver:
+                capabilities = driver.capabilities
         info["browser_launch"] = "success"
-        info["browser_version"] = driver.capabilities.get("browserVersion", "unknown")
-        info["chromedriver_actual"] = driver.capabilities.get("chrome", {}).get("chromedriverVersion", "unknown")
-        cleanup_driver(driver, temp_profile)
+        info["browser_version"] = capabilities.get("browserVersion", "unknown")
+        info["chromedriver_actual"] = capabilities.get("chrome", {}).get("chromedriverVersion", "unknown")
+        _debug_info = info
     except Exception as e:
         info["browser_launch"] = "failed"
         info["browser_error"] = str(e)
 
-    return info
+    return {**info, "cached": False, "checked_at": datetime.now().isoformat()}
 
 
 @app.post("/test-login")
@@ -527,7 +1654,12 @@ async def test_login(
 ):
     verify_auth(authorization)
     try:
-        result = await asyncio.to_thread(_do_test_login, req.username, req.password)
+        if await test_login_with_cached_session(req.username, req.password):
+            return {"success": True, "message": "Login successful (cached session)"}
+        if await login_over_http(req.username, req.password):
+            return {"success": True, "message": "Login successful (HTTP)"}
+        async with driver_pool.acquire(credential_key(req.username, req.password)) as driver:
+            result = await asyncio.to_thread(_do_test_login, driver, req.username, req.password)
         return result
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Login failed: {str(e)}")
@@ -537,14 +1669,89 @@ async def test_login(
 async def scrape(
     req: ScrapeRequest,
     authorization: Optional[str] = Header(None),
+    accept: Optional[str] = Header(None),
 ):
     verify_auth(authorization)
     try:
-        result = await asyncio.to_thread(
-            _do_scrape, req.username, req.password,
-            req.listing_status, req.time_range, req.max_pages,
-            req.min_acres,
-        )
-        return result
+        if req.format == "csv" or wants_csv(accept):
+            return await scrape_csv_response(req)
+        result_key = result_cache_key(req)
+        result = None if req.no_cache else cached_result(result_key)
+        if result is None:
+            result = await scrape_with_cached_session(
+                req.username, req.password,
+                req.listing_status, req.time_range, req.max_pages,
+                req.min_acres,
+            )
+            if result is None:
+                async with driver_pool.acquire(credential_key(req.username, req.password)) as driver:
+                    result = await asyncio.to_thread(
+                        _do_scrape, driver, req.username, req.password,
+                        req.listing_status, req.time_range, req.max_pages,
+                        req.min_acres,
+                    )
+            remember_result(result_key, result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+    if wants_ndjson(accept):
+        # One listing per line; counts go in headers since there is no envelope
+        return StreamingResponse(
+            iter_ndjson(result["listings"]),
+            media_type=NDJSON_MEDIA_TYPE,
+            headers={
+                "X-Total-Count": str(result["total_count"]),
+                "X-Pages-Scraped": str(result["pages_scraped"]),
+                "X-Errors": str(result["errors"]),
+            },
+        )
+    return result
+
+
+@app.post("/scrape-stream")
+async def scrape_stream(
+    req: ScrapeRequest,
+    authorization: Optional[str] = Header(None),
+):
+    """
+    Server-sent events version of /scrape: `status` events per phase, one `listing` event per
+    row as each batch of pages arrives, then `complete` with the counts (or `error`).
+    """
+    verify_auth(authorization)
+
+    async def generate():
+        try:
+            result = await scrape_with_cached_session(
+                req.username, req.password,
+                req.listing_status, req.time_range, req.max_pages,
+                req.min_acres,
+            )
+            if result is not None:
+                for listing in result["listings"]:
+                    yield sse_event("listing", listing)
+                yield sse_event("complete", {"total_count": result["total_count"],
+                                             "pages_scraped": result["pages_scraped"],
+                                             "errors": result["errors"]})
+                return
+
+            async with driver_pool.acquire(credential_key(req.username, req.password)) as driver:
+                events = iter_scrape(
+                    driver, req.username, req.password,
+                    req.listing_status, req.time_range, req.max_pages,
+                    req.min_acres, batch_pages=STREAM_BATCH_PAGES,
+                )
+                # aclosing: the driver must not go back to the pool while the thread still uses it
+                async with aclosing(iterate_in_thread(events)) as items:
+                    async for event, data in items:
+                        if event == "listings":
+                            for listing in data:
+                                yield sse_event("listing", listing)
+                        else:
+                            yield sse_event(event, data)
+        except Exception as e:
+            yield sse_event("error", {"detail": str(e)})
+
+    # GZipMiddleware buffers streamed chunks inside the compressor, which would hold SSE
+    # events back; an explicit Content-Encoding makes it pass the stream through untouched.
+    return StreamingResponse(generate(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "Content-Encoding": "identity"})
@@ -0,0 +1,186 @@
+"""
+Client disconnects must not leak pooled Chrome instances.
+
+Run with: python -m unittest discover tests
+"""
+
+import os
+import time
+import tempfile
+import threading
+import unittest
+from contextlib import aclosing
+from unittest import mock
+
+import anyio
+
+import main
+
+
+class FakeDriver:
+    pass
+
+
+class DisconnectTest(unittest.TestCase):
+    def setUp(self):
+        self.events = []
+        self.stepping = threading.Event()
+        patches = [
+            mock.patch.object(main, "create_driver", lambda *a: FakeDriver()),
+            mock.patch.object(main, "reset_driver", self._record("reset", True)),
+            mock.patch.object(main, "cleanup_driver", self._record("quit", None)),
+            mock.patch.object(main, "driver_alive", lambda driver: True),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def _record(self, name, result):
+        def fn(driver):
+            time.sleep(0.05)
+            self.events.append(name)
+            return result
+        return fn
+
+    def _slow_steps(self):
+        # Stands in for iter_scrape: each step blocks its thread like a Selenium call
+        for i in range(3):
+            self.stepping.set()
+            time.sleep(0.3)
+            self.events.append(f"step {i}")
+            yield i
+
+    def _disconnect_mid_stream(self, pool, owner=None):
+        """Consume a stream inside a checkout and cancel it the way Starlette does on disconnect."""
+        async def consumer():
+            async with pool.acquire(owner):
+                async with aclosing(main.iterate_in_thread(self._slow_steps())) as items:
+                    async for _ in items:
+                        pass
+
+        async def run():
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(consumer)
+                await anyio.to_thread.run_sync(self.stepping.wait)
+                tg.cancel_scope.cancel()
+
+        anyio.run(run)
+
+    def test_pooled_driver_returns_to_pool(self):
+        pool = main.DriverPool(1)
+        self._disconnect_mid_stream(pool)
+        self.assertEqual(len(pool._live), 1)
+        self.assertEqual(len(pool._idle), 1)
+        self.assertEqual(pool._slots._value, 1)
+        # The driver was only reset once the worker thread had finished its step
+        self.assertEqual(self.events, ["step 0", "reset"])
+
+    def test_profile_driver_quits_before_unlock(self):
+        with tempfile.TemporaryDirectory() as root, mock.patch.object(main, "PROFILE_ROOT", root):
+            lock_path = os.path.join(root, "a" * 64, main._PROFILE_LOCK)
+
+            def cleanup(driver):
+                time.sleep(0.05)
+                # Another request must not get the profile while this Chrome still has it open
+                fd = main._try_lock(lock_path)
+                self.events.append("quit" if fd is None else "quit after unlock")
+                if fd is not None:
+                    os.close(fd)
+
+            pool = main.DriverPool(1)
+            with mock.patch.object(main, "cleanup_driver", cleanup):
+                self._disconnect_mid_stream(pool, owner="a" * 64)
+            self.assertEqual(len(pool._live), 0)
+            self.assertEqual(self.events, ["step 0", "quit"])
+            fd = main._try_lock(lock_path)
+            self.assertIsNotNone(fd)
+            os.close(fd)
+
+
+class ProfileModeTest(unittest.TestCase):
+    """With PROFILE_ROOT set, owned checkouts must stay within the pool's browser cap."""
+
+    def setUp(self):
+        self.live_counts = []
+        root = tempfile.TemporaryDirectory()
+        self.addCleanup(root.cleanup)
+        patches = [
+            mock.patch.object(main, "PROFILE_ROOT", root.name),
+            mock.patch.object(main, "PROFILE_MAX_COUNT", 0),
+            mock.patch.object(main, "DRIVER_LOGIN_TTL", 0),
+            mock.patch.object(main, "create_driver", lambda *a: FakeDriver()),
+            mock.patch.object(main, "reset_driver", lambda driver: True),
+            mock.patch.object(main, "cleanup_driver", lambda driver: None),
+            mock.patch.object(main, "driver_alive", lambda driver: True),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def _checkouts(self, pool, owners):
+        async def checkout(owner):
+            async with pool.acquire(owner):
+                self.live_counts.append(len(pool._live))
+                await anyio.sleep(0.05)
+
+        async def run():
+            await pool.start()
+            async with anyio.create_task_group() as tg:
+                for owner in owners:
+                    tg.start_soon(checkout, owner)
+            self.live_counts.append(len(pool._live))
+
+        anyio.run(run)
+
+    def test_no_incognito_prewarm(self):
+        pool = main.DriverPool(2)
+        self._checkouts(pool, ["a" * 64, "b" * 64])
+        self.assertEqual(pool._idle, [])
+        self.assertLessEqual(max(self.live_counts), 2)
+
+    def test_ownerless_drivers_are_not_kept(self):
+        pool = main.DriverPool(2)
+        # Owner-less checkouts (like /debug's) must not leave incognito drivers beside the profiles
+        self._checkouts(pool, [None, "a" * 64, None, "b" * 64, "c" * 64])
+        self.assertEqual(pool._idle, [])
+        self.assertEqual(len(pool._live), 0)
+        self.assertLessEqual(max(self.live_counts), 2)
+
+
+class PruneProfilesTest(unittest.TestCase):
+    def setUp(self):
+        root = tempfile.TemporaryDirectory()
+        self.addCleanup(root.cleanup)
+        self.root = root.name
+        patch = mock.patch.object(main, "PROFILE_ROOT", self.root)
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def _profile(self, name, last_used):
+        os.makedirs(os.path.join(self.root, name))
+        lock_path = os.path.join(self.root, name, main._PROFILE_LOCK)
+        open(lock_path, "w").close()
+        os.utime(lock_path, (last_used, last_used))
+        return lock_path
+
+    def test_evicts_least_recently_used(self):
+        for i, name in enumerate(["old", "middle", "new"]):
+            self._profile(name, 1000 + i)
+        main.prune_profiles(2)
+        self.assertEqual(sorted(os.listdir(self.root)), ["middle", "new"])
+
+    def test_skips_profile_in_use(self):
+        held = main._try_lock(self._profile("old", 1000))
+        self.addCleanup(os.close, held)
+        self._profile("middle", 1001)
+        self._profile("new", 1002)
+        main.prune_profiles(1)
+        self.assertEqual(sorted(os.listdir(self.root)), ["new", "old"])
+
+    def test_lock_on_deleted_profile(self):
+        # The directory went away between lock_profile's makedirs and the open
+        self.assertIsNone(main._try_lock(os.path.join(self.root, "gone", main._PROFILE_LOCK)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+"""
+Rows from PCC's CSV export must encode in every /scrape response format.
+
+Run with: python -m unittest discover tests
+"""
+
+import unittest
+
+import anyio
+import orjson
+
+import main
+
+
+# The second row has one field more than the header (a trailing comma)
+CSV_PAGE = "InventoryID,Name\r\n1,a,\r\n2,b\r\n"
+
+
+class ListingsTest(unittest.TestCase):
+    def setUp(self):
+        self.listings, errors = main.collect_listings([{"error": None, "text": CSV_PAGE, "page": 1}], set())
+        self.assertEqual(errors, 0)
+
+    def test_extra_fields_are_dropped(self):
+        self.assertEqual(self.listings, [{"InventoryID": "1", "Name": "a"}, {"InventoryID": "2", "Name": "b"}])
+
+    def test_ndjson(self):
+        async def collect():
+            return b"".join([chunk async for chunk in main.iter_ndjson(self.listings)])
+
+        lines = anyio.run(collect).splitlines()
+        self.assertEqual([orjson.loads(line) for line in lines], self.listings)
+
+    def test_sse(self):
+        event = main.sse_event("listings", self.listings)
+        self.assertTrue(event.startswith(b"event: listings\ndata: "))
+        self.assertEqual(orjson.loads(event.split(b"data: ", 1)[1]), self.listings)
+
+    def test_csv(self):
+        # scrape_csv_response takes the header from the first row
+        body = main.encode_csv(self.listings, list(self.listings[0]), True)
+        self.assertEqual(body, b"InventoryID,Name\r\n1,a\r\n2,b\r\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+"""
+Reading PCC's login form and telling a logged-in page from anything else, for the HTTP login.
+
+Run with: python -m unittest discover tests
+"""
+
+import unittest
+
+import main
+
+
+LOGIN_PAGE = """
+<form action="/search/" method="get"><input type="text" name="q"></form>
+<form action="?action=login" method="post">
+  <input type="hidden" name="token" value="abc123">
+  <input type="text" name="username">
+  <input type="password" name="password" value="">
+  <input type="checkbox" name="remember" value="1">
+  <input type="submit" name="login" value="Login">
+  <input type="submit" name="cancel" value="Cancel">
+</form>
+"""
+
+LOGGED_IN_PAGE = """
+<ul class="menu">
+  <li class="toproot"><a href="#">Search</a>
+    <ul><li><a href="/users/?action=powersearch">Power Search</a></li></ul>
+  </li>
+</ul>
+"""
+
+
+class LoginFormTest(unittest.TestCase):
+    def test_reads_the_form_holding_the_username(self):
+        action, fields = main.login_form_fields(LOGIN_PAGE)
+        self.assertEqual(action, "/users/?action=login")
+        # Checkboxes are left out, and only the first submit button is sent, as a click would
+        self.assertEqual(fields, {"token": "abc123", "username": "", "password": "", "login": "Login"})
+
+    def test_form_without_action_posts_to_the_login_page(self):
+        action, _ = main.login_form_fields('<form><input name="username"></form>')
+        self.assertEqual(action, "/users/")
+
+    def test_no_login_form(self):
+        self.assertIsNone(main.login_form_fields(LOGGED_IN_PAGE))
+        self.assertIsNone(main.login_form_fields('<form><input name="q"></form><input name="username">'))
+
+
+class LoggedInPageTest(unittest.TestCase):
+    def test_search_menu_means_logged_in(self):
+        self.assertTrue(main.is_logged_in_page(LOGGED_IN_PAGE))
+
+    def test_login_form_is_not_logged_in(self):
+        self.assertFalse(main.is_logged_in_page(LOGIN_PAGE))
+        self.assertFalse(main.is_logged_in_page(LOGGED_IN_PAGE + LOGIN_PAGE))
+
+    def test_page_without_either_is_not_logged_in(self):
+        # An Akamai challenge or error page has no login form, but isn't a logged-in page either
+        self.assertFalse(main.is_logged_in_page("<html><body>Access Denied</body></html>"))
+        self.assertFalse(main.is_logged_in_page("<p>Invalid login. Please try again.</p>"))
+
+
+if __name__ == "__main__":
+    unittest.main()